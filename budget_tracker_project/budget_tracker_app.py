@@ -1,36 +1,118 @@
 # Budget Tracker Application
 
 # Imports
+import atexit
+import re
 import sqlite3
 import os
-from datetime import datetime
-
-
-def create_connection(db_name):
-    """
-    Creates a connection to the SQLite database and returns the connection
-    and cursor.
-
-    :param db_name: The name of the SQLite database.
-    :type db_name: str
-
-    :returns: A tuple containing the database connection and cursor.
-    :rtype: tuple
-    """
-    connection = sqlite3.connect(db_name)
-    cursor = connection.cursor()
-    return connection, cursor
-
-
-def commit_and_close(connection):
-    """
-    Commits any changes and closes the database connection.
-
-    :param connection: The database connection to commit and close.
-    :type connection: sqlite3.Connection
+import sys
+from contextlib import contextmanager
+from datetime import date
+
+DB_NAME = "expense_tracker.db"
+
+# Shared connection and cursor, opened lazily by get_connection(). The app
+# is single-threaded; guard them with a lock if threads are ever added.
+_CONN = None
+_CUR = None
+
+# Set of categories (or goals) per table, loaded on first lookup and then
+# kept in step with the writes that add or remove one.
+_CATEGORY_CACHE = {}
+
+# Queries shared by the lookup, goals and summary functions, kept in one
+# place. The distinct_* entries are looked up by table name so that names
+# are never interpolated into SQL.
+_STMTS = {
+    "distinct_expenses": "SELECT DISTINCT category FROM expenses",
+    "distinct_income": "SELECT DISTINCT category FROM income",
+    "distinct_budgets": "SELECT DISTINCT category FROM budgets",
+    "distinct_financial_goals": "SELECT DISTINCT goal FROM financial_goals",
+    "all_goals": "SELECT * FROM financial_goals",
+    "summary_totals": '''SELECT
+        (SELECT COALESCE(SUM(amount), 0.0) FROM income) AS total_income,
+        (SELECT COALESCE(SUM(amount), 0.0) FROM expenses) AS total_expenses,
+        (SELECT COALESCE(SUM(budget_amount), 0.0) FROM budgets)
+            AS total_budgeted,
+        EXISTS (SELECT 1 FROM expenses) AS has_expenses,
+        (SELECT group_concat(goal, char(10)) FROM financial_goals
+         WHERE saved_amount >= target_amount) AS achieved_goals''',
+    "summary_by_category": '''SELECT e.category AS category,
+        SUM(e.amount) AS expense_amount, b.budget_amount AS budget_amount
+        FROM expenses e
+        LEFT JOIN budgets b ON b.category = e.category
+        GROUP BY e.category''',
+}
+
+# Matches any digit, used to reject category names containing numbers.
+_DIGIT_RE = re.compile(r"\d")
+
+# Matches a plain decimal amount such as 12, -3 or 45.50.
+_NUM_RE = re.compile(r"-?\d+(\.\d+)?")
+
+# Whether menu choices come from a terminal rather than a pipe or script.
+_INTERACTIVE = sys.stdin is not None and sys.stdin.isatty()
+
+
+def get_connection():
+    """
+    Returns the shared connection to the SQLite database, opening it on
+    first use.
+
+    The connection is kept for the lifetime of the process so each action
+    reuses the already parsed schema instead of reopening the database file.
+    It runs in autocommit mode with write-ahead logging enabled and tuned
+    cache, temp-store and busy-timeout settings, and is closed on exit.
+    Rows are returned as ``sqlite3.Row`` so columns can be read by name.
+
+    :returns: The shared database connection.
+    :rtype: sqlite3.Connection
+    """
+    global _CONN, _CUR
+    if _CONN is None:
+        _CONN = sqlite3.connect(DB_NAME, check_same_thread=False,
+                                isolation_level=None, cached_statements=256)
+        _CONN.row_factory = sqlite3.Row
+        _CUR = _CONN.cursor()
+        # WAL turns each commit into a single sequential append and lets
+        # readers run alongside a writer.
+        _CUR.execute("PRAGMA journal_mode=WAL")
+        _CUR.execute("PRAGMA synchronous=NORMAL")
+        _CUR.execute("PRAGMA temp_store=MEMORY")
+        _CUR.execute("PRAGMA mmap_size=268435456")
+        _CUR.execute("PRAGMA cache_size=-64000")
+        _CUR.execute("PRAGMA busy_timeout=5000")
+        atexit.register(_CONN.close)
+    return _CONN
+
+
+def get_cursor():
+    """
+    Returns the cursor shared by all database operations.
+
+    :returns: The shared database cursor.
+    :rtype: sqlite3.Cursor
+    """
+    get_connection()
+    return _CUR
+
+
+@contextmanager
+def write_transaction():
+    """
+    Runs the enclosed statements in a single write transaction.
+
+    The write lock is taken up front with ``BEGIN IMMEDIATE``. The
+    transaction is committed when the block exits normally and rolled back
+    if it raises.
+
+    :returns: A context manager yielding the shared database cursor.
+    :rtype: contextlib.AbstractContextManager
     """
-    connection.commit()
-    connection.close()
+    connection = get_connection()
+    with connection:
+        _CUR.execute("BEGIN IMMEDIATE")
+        yield _CUR
 
 
 def create_database():
@@ -41,8 +123,8 @@ def create_database():
     financial goals. It also pre-populates the tables with example data
     if the database is being created for the first time.
     """
-    db_exists = os.path.exists("expense_tracker.db")
-    connection, cursor = create_connection("expense_tracker.db")
+    db_exists = os.path.exists(DB_NAME)
+    cursor = get_cursor()
 
     # Create tables for expenses and income
     cursor.execute('''
@@ -80,45 +162,62 @@ def create_database():
         )
     ''')
 
-    # Pre-populate the tables with example data.
+    # Index the columns used for lookups. Categories are unique per table.
+    cursor.execute('''CREATE UNIQUE INDEX IF NOT EXISTS idx_expenses_cat
+                   ON expenses (category)''')
+    cursor.execute('''CREATE UNIQUE INDEX IF NOT EXISTS idx_income_cat
+                   ON income (category)''')
+    cursor.execute('''CREATE UNIQUE INDEX IF NOT EXISTS idx_budgets_cat
+                   ON budgets (category)''')
+    cursor.execute('''CREATE INDEX IF NOT EXISTS idx_goals_goal
+                   ON financial_goals (goal)''')
+    # Let SUM(amount) scan the narrow index instead of the table rows.
+    cursor.execute('''CREATE INDEX IF NOT EXISTS idx_expenses_amount
+                   ON expenses (amount)''')
+    cursor.execute('''CREATE INDEX IF NOT EXISTS idx_income_amount
+                   ON income (amount)''')
+
+    # Pre-populate the tables with example data in a single transaction.
     if not db_exists:
-        cursor.executemany('''INSERT INTO expenses (category, amount, due_date)
-                           VALUES (?, ?, ?)''', [
-            ("Groceries", 50.0, "2024-12-01"),
-            ("Utilities", 100.0, "2024-12-02"),
-            ("Transport", 20.0, "2024-12-03"),
-            ("Dining", 30.0, "2024-12-04"),
-            ("Entertainment", 40.0, "2024-12-05")
-        ])
-
-        cursor.executemany('''INSERT INTO income (category, amount, pay_date)
-                           VALUES (?, ?, ?)''', [
-            ("Salary", 2000.0, "2024-12-01"),
-            ("Freelancing", 500.0, "2024-12-02"),
-            ("Investments", 300.0, "2024-12-03"),
-            ("Gifts", 100.0, "2024-12-04"),
-            ("Other", 50.0, "2024-12-05")
-        ])
-
-        cursor.executemany('''INSERT INTO budgets (category, budget_amount)
-                           VALUES (?, ?)''', [
-            ("Groceries", 300.0),
-            ("Utilities", 150.0),
-            ("Transport", 100.0),
-            ("Dining", 200.0),
-            ("Entertainment", 150.0)
-        ])
-
-        cursor.executemany('''INSERT INTO financial_goals (goal, target_amount,
-                           saved_amount) VALUES (?, ?, ?)''', [
-            ("Buy a car", 20000.0, 5000.0),
-            ("Vacation", 5000.0, 1500.0),
-            ("Emergency fund", 10000.0, 3000.0),
-            ("Home renovation", 15000.0, 4000.0),
-            ("New laptop", 2000.0, 800.0)
-        ])
-
-    commit_and_close(connection)
+        with write_transaction():
+            cursor.executemany('''INSERT INTO expenses
+                               (category, amount, due_date)
+                               VALUES (?, ?, ?)''', [
+                ("Groceries", 50.0, "2024-12-01"),
+                ("Utilities", 100.0, "2024-12-02"),
+                ("Transport", 20.0, "2024-12-03"),
+                ("Dining", 30.0, "2024-12-04"),
+                ("Entertainment", 40.0, "2024-12-05")
+            ])
+
+            cursor.executemany('''INSERT INTO income
+                               (category, amount, pay_date)
+                               VALUES (?, ?, ?)''', [
+                ("Salary", 2000.0, "2024-12-01"),
+                ("Freelancing", 500.0, "2024-12-02"),
+                ("Investments", 300.0, "2024-12-03"),
+                ("Gifts", 100.0, "2024-12-04"),
+                ("Other", 50.0, "2024-12-05")
+            ])
+
+            cursor.executemany('''INSERT INTO budgets (category, budget_amount)
+                               VALUES (?, ?)''', [
+                ("Groceries", 300.0),
+                ("Utilities", 150.0),
+                ("Transport", 100.0),
+                ("Dining", 200.0),
+                ("Entertainment", 150.0)
+            ])
+
+            cursor.executemany('''INSERT INTO financial_goals
+                               (goal, target_amount, saved_amount)
+                               VALUES (?, ?, ?)''', [
+                ("Buy a car", 20000.0, 5000.0),
+                ("Vacation", 5000.0, 1500.0),
+                ("Emergency fund", 10000.0, 3000.0),
+                ("Home renovation", 15000.0, 4000.0),
+                ("New laptop", 2000.0, 800.0)
+            ])
 
 
 def get_category(prompt):
@@ -145,7 +244,7 @@ def get_category(prompt):
             if not user_input:  # Check if input is empty.
                 raise ValueError("Input cannot be empty!")
             # Check if input contains numbers.
-            if any(char.isdigit() for char in user_input):
+            if _DIGIT_RE.search(user_input):
                 raise ValueError("A Category cannot contain numbers!")
             return user_input
         except ValueError as e:
@@ -167,11 +266,11 @@ def get_amount(prompt):
         if not user_input:
             print("Inout cannot be empty!. Please enter a valid amount.")
             continue
-        try:
-            return float(user_input)
-        except ValueError:
+        if not _NUM_RE.fullmatch(user_input):
             print("An amount cannot contain characters!."
                   " Please enter a valid amount.")
+            continue
+        return float(user_input)
 
 
 # Function to get valid date input
@@ -191,12 +290,41 @@ def get_date(prompt):
             print("Input cannot be empty. Please enter a valid date.")
             continue
         try:
-            valid_date = datetime.strptime(user_input, "%Y-%m-%d").date()
+            valid_date = date.fromisoformat(user_input)
             return valid_date
         except ValueError:
             print("Invalid date format. Please use YYYY-MM-DD.")
 
 
+def _remember_category(table_name, category):
+    """
+    Adds a category to the cached set for a table, if it has been loaded.
+
+    :param table_name: The name of the table the category was added to.
+    :type table_name: str
+    :param category: The category that was added.
+    :type category: str
+    """
+    categories = _CATEGORY_CACHE.get(table_name)
+    if categories is not None:
+        categories.add(category)
+
+
+def _forget_category(table_name, category):
+    """
+    Removes a category from the cached set for a table, if it has been
+    loaded.
+
+    :param table_name: The name of the table the category was deleted from.
+    :type table_name: str
+    :param category: The category that was deleted.
+    :type category: str
+    """
+    categories = _CATEGORY_CACHE.get(table_name)
+    if categories is not None:
+        categories.discard(category)
+
+
 def validate_category_input(table_name):
     """
     Validates user input for category by comparing it with existing categories.
@@ -211,19 +339,21 @@ def validate_category_input(table_name):
     :rtype: str
     """
     try:
-        connection, cursor = create_connection("expense_tracker.db")
-        cursor.execute(f'''SELECT DISTINCT category FROM {table_name}''')
-        categories = [row[0] for row in cursor.fetchall()]
+        categories = _CATEGORY_CACHE.get(table_name)
+        if categories is None:
+            cursor = get_cursor()
+            cursor.execute(_STMTS["distinct_" + table_name])
+            categories = {row[0] for row in cursor}
+            _CATEGORY_CACHE[table_name] = categories
 
         print("Available categories:")
-        for category in categories:
+        for category in sorted(categories):
             print(f"- {category}")
 
         while True:
             user_input = input("Enter a category from the list above:"
                                " ").strip().capitalize()
             if user_input in categories:
-                connection.close()
                 return user_input
             else:
                 print("Invalid category. Please choose from the list.")
@@ -266,19 +396,21 @@ def validate_financial_goal_input(table_name):
     :rtype: str
     """
     try:
-        connection, cursor = create_connection("expense_tracker.db")
-        cursor.execute(f'''SELECT DISTINCT goal FROM {table_name}''')
-        goals = [row[0] for row in cursor.fetchall()]
+        goals = _CATEGORY_CACHE.get(table_name)
+        if goals is None:
+            cursor = get_cursor()
+            cursor.execute(_STMTS["distinct_" + table_name])
+            goals = {row[0] for row in cursor}
+            _CATEGORY_CACHE[table_name] = goals
 
         print("Available categories:")
-        for goal in goals:
+        for goal in sorted(goals):
             print(f"- {goal}")
 
         while True:
             user_input = input("Enter a financial goal from the list "
                                "above: ").strip().capitalize()
             if user_input in goals:
-                connection.close()
                 return user_input
             else:
                 print("Invalid category. Please choose from the list.")
@@ -316,27 +448,71 @@ def insert_expense(expense_category, expense_amount, expense_due_date):
     :raises Exception: If there is an error during the database operation.
     """
     try:
-        # Convert the date to ISO format string for SQLite compatibility
-        # Convert date to string in the format YYYY-MM-DD
-        date_str = expense_due_date.isoformat()
-        # Connect to SQLite database
-        connection, cursor = create_connection("expense_tracker.db")
-        # Insert data into the table ensuring that it does not already exists.
-        cursor.execute('''SELECT category FROM expenses
-                       WHERE category = ?''', (expense_category,))
-        if cursor.fetchone():
+        inserted = insert_expenses([(expense_category, expense_amount,
+                                     expense_due_date)])
+        if inserted == 0:
             print("Category already exists. Please update the existing"
                   " category or use a different name.")
         else:
-            cursor.execute('''INSERT INTO expenses (category, amount, due_date)
-                           VALUES (?, ?, ?)''',
-                           (expense_category, expense_amount, date_str))
             print("Expense added successfully!")
-        commit_and_close(connection)
     except Exception as e:
         print(f"Error: {e}")
 
 
+def add_multiple_expenses():
+    """
+    Prompts the user for several expenses, then inserts them all into the
+    database in a single transaction.
+
+    Expenses whose category already exists are skipped and counted.
+    """
+    expenses = []
+    while True:
+        expense_category = get_category(prompt="Enter an expense category: ")
+        expense_amount = get_amount(prompt="Enter an expense amount: ")
+        expense_due_date = get_date(prompt="Enter due date (YYYY-MM-DD): ")
+        expenses.append((expense_category, expense_amount, expense_due_date))
+        if input("Add another expense? (y/n): ").strip().lower() != "y":
+            break
+
+    try:
+        inserted = insert_expenses(expenses)
+        print(f"{inserted} expense(s) added successfully!")
+        if inserted < len(expenses):
+            print(f"{len(expenses) - inserted} expense(s) skipped because"
+                  f" the category already exists.")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def insert_expenses(expenses):
+    """
+    Inserts several expenses into the SQLite database in one transaction,
+    skipping any whose category already exists.
+
+    :param expenses: The (category, amount, due date) of each expense.
+    :type expenses: list[tuple[str, float, datetime.date]]
+
+    :returns: The number of expenses inserted.
+    :rtype: int
+
+    :raises Exception: If there is an error during the database operation.
+    """
+    # Convert the dates to ISO format strings (YYYY-MM-DD) for SQLite
+    rows = [(category, amount, due_date.isoformat())
+            for category, amount, due_date in expenses]
+    # Insert data into the table ensuring that it does not already exists.
+    with write_transaction() as cursor:
+        cursor.executemany('''INSERT OR IGNORE INTO expenses
+                           (category, amount, due_date) VALUES (?, ?, ?)''',
+                           rows)
+        inserted = cursor.rowcount
+    # Every category in the batch exists now, inserted or not.
+    for category, _, _ in rows:
+        _remember_category("expenses", category)
+    return inserted
+
+
 def view_expenses():
     """
     Retrieves and displays all expenses stored in the SQLite database.
@@ -347,19 +523,16 @@ def view_expenses():
     :raises Exception: If there is an error during database operations.
 
     :variables:
-        - `connection` (sqlite3.Connection): The database connection object.
         - `cursor` (sqlite3.Cursor): The database cursor object.
     """
     try:
-        connection, cursor = create_connection("expense_tracker.db")
+        cursor = get_cursor()
         cursor.execute('''SELECT * FROM expenses''')
-        rows = cursor.fetchall()
 
         print("\nExpenses:")
-        for row in rows:
+        for row in cursor:
             print(f"ID: {row[0]}, Category: {row[1]}, Amount: {row[2]},"
                   f" Due date: {row[3]}")
-        connection.close()
     except Exception as e:
         print(f"Error: {e}")
 
@@ -379,20 +552,17 @@ def view_expenses_by_category():
 
     :variables:
         - `income_category` (str): The category of income to retrieve.
-        - `connection` (sqlite3.Connection): The database connection object.
         - `cursor` (sqlite3.Cursor): The database cursor object.
     """
     try:
         expense_category = validate_category_input("expenses")
-        connection, cursor = create_connection("expense_tracker.db")
-        cursor.execute('''SELECT * FROM expenses WHERE category = ?''',
-                       (expense_category,))
-        rows = cursor.fetchall()
+        cursor = get_cursor()
+        cursor.execute('''SELECT id, amount, due_date FROM expenses
+                       WHERE category = ?''', (expense_category,))
 
         print(f"\nExpenses in category '{expense_category}':")
-        for row in rows:
-            print(f"ID: {row[0]}, Amount: {row[2]}, Due date: {row[3]}")
-        connection.close()
+        for row in cursor:
+            print(f"ID: {row[0]}, Amount: {row[1]}, Due date: {row[2]}")
     except Exception as e:
         print(f"Error: {e}")
 
@@ -410,17 +580,16 @@ def update_expense():
     :variables:
         - `expense_category` (str): The category of the expense to update.
         - `new_amount` (float): The new expense amount.
-        - `connection` (sqlite3.Connection): The database connection object.
         - `cursor` (sqlite3.Cursor): The database cursor object.
     """
     try:
         print("\n--- Update An Expense Amount ---")
         expense_category = validate_category_input("expenses")
         new_amount = get_amount(prompt="Enter a new expense amount: ")
-        connection, cursor = create_connection("expense_tracker.db")
-        cursor.execute('''UPDATE expenses SET amount = ? WHERE category = ?''',
-                       (new_amount, expense_category))
-        commit_and_close(connection)
+        with write_transaction() as cursor:
+            cursor.execute('''UPDATE expenses SET amount = ?
+                           WHERE category = ?''',
+                           (new_amount, expense_category))
         print(f"Expense updated successfully for"
               f" category '{expense_category}'.")
     except Exception as e:
@@ -439,12 +608,16 @@ def delete_expense():
     try:
         print("\n--- Delete An Expense ---")
         category = validate_category_input("expenses")
-        connection, cursor = create_connection("expense_tracker.db")
-        # Delete the expense from the expenses table
-        cursor.execute("DELETE FROM expenses WHERE category = ?", (category,))
-        # Delete the corresponding budget from the budgets table
-        cursor.execute("DELETE FROM budgets WHERE category = ?", (category,))
-        commit_and_close(connection)
+        # Run both deletes in one write transaction, rolled back on error.
+        with write_transaction() as cursor:
+            # Delete the expense from the expenses table
+            cursor.execute("DELETE FROM expenses WHERE category = ?",
+                           (category,))
+            # Delete the corresponding budget from the budgets table
+            cursor.execute("DELETE FROM budgets WHERE category = ?",
+                           (category,))
+        _forget_category("expenses", category)
+        _forget_category("budgets", category)
         print(f"Expense and corresponding budget deleted successfully for"
               f" category '{category}'.")
     except Exception as e:
@@ -461,14 +634,10 @@ def total_expenses():
     :raises Exception: If there is an error during the database operation.
     """
     try:
-        connection, cursor = create_connection("expense_tracker.db")
-        cursor.execute('''SELECT SUM(amount) FROM expenses''')
+        cursor = get_cursor()
+        cursor.execute('''SELECT COALESCE(SUM(amount), 0.0) FROM expenses''')
         total = cursor.fetchone()[0]
-
-        if total is None:
-            total = 0.0
         print(f"Total Expenses: {total}")
-        connection.close()
     except Exception as e:
         print(f"Error: {e}")
 
@@ -500,28 +669,72 @@ def insert_income(income_category, income_amount, income_pay_date):
 
     :raises Exception: If there is an error during the database operation.
     """
-    # Convert the date to ISO format string for SQLite compatibility
-    # Convert date to string in the format YYYY-MM-DD
     try:
-        date_str = income_pay_date.isoformat()
-        # Connect to SQLite database
-        connection, cursor = create_connection("expense_tracker.db")
-        # Insert data into the table ensuring that it does bot already exists.
-        cursor.execute('''SELECT category FROM income WHERE category = ?''',
-                       (income_category,))
-        if cursor.fetchone():
+        inserted = insert_incomes([(income_category, income_amount,
+                                    income_pay_date)])
+        if inserted == 0:
             print("Category already exists. Please update the existing"
                   " category or use a different name.")
         else:
-            cursor.execute('''INSERT INTO income (category, amount, pay_date)
-                           VALUES (?, ?, ?)''',
-                           (income_category, income_amount, date_str))
             print("Income added successfully!")
-        commit_and_close(connection)
     except Exception as e:
         print(f"Error: {e}")
 
 
+def add_multiple_incomes():
+    """
+    Prompts the user for several incomes, then inserts them all into the
+    database in a single transaction.
+
+    Incomes whose category already exists are skipped and counted.
+    """
+    incomes = []
+    while True:
+        income_category = get_category(prompt="Enter an income category: ")
+        income_amount = get_amount(prompt="Enter an income amount: ")
+        income_pay_date = get_date(prompt="Enter pay date (YYYY-MM-DD): ")
+        incomes.append((income_category, income_amount, income_pay_date))
+        if input("Add another income? (y/n): ").strip().lower() != "y":
+            break
+
+    try:
+        inserted = insert_incomes(incomes)
+        print(f"{inserted} income(s) added successfully!")
+        if inserted < len(incomes):
+            print(f"{len(incomes) - inserted} income(s) skipped because"
+                  f" the category already exists.")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def insert_incomes(incomes):
+    """
+    Inserts several incomes into the SQLite database in one transaction,
+    skipping any whose category already exists.
+
+    :param incomes: The (category, amount, pay date) of each income.
+    :type incomes: list[tuple[str, float, datetime.date]]
+
+    :returns: The number of incomes inserted.
+    :rtype: int
+
+    :raises Exception: If there is an error during the database operation.
+    """
+    # Convert the dates to ISO format strings (YYYY-MM-DD) for SQLite
+    rows = [(category, amount, pay_date.isoformat())
+            for category, amount, pay_date in incomes]
+    # Insert data into the table ensuring that it does not already exists.
+    with write_transaction() as cursor:
+        cursor.executemany('''INSERT OR IGNORE INTO income
+                           (category, amount, pay_date) VALUES (?, ?, ?)''',
+                           rows)
+        inserted = cursor.rowcount
+    # Every category in the batch exists now, inserted or not.
+    for category, _, _ in rows:
+        _remember_category("income", category)
+    return inserted
+
+
 def view_income():
     """
     Retrieves and displays all incomes stored in the SQLite database.
@@ -532,19 +745,16 @@ def view_income():
     :raises Exception: If there is an error during database operations.
 
     :variables:
-        - `connection` (sqlite3.Connection): The database connection object.
         - `cursor` (sqlite3.Cursor): The database cursor object.
     """
     try:
-        connection, cursor = create_connection("expense_tracker.db")
+        cursor = get_cursor()
         cursor.execute('''SELECT * FROM income''')
-        rows = cursor.fetchall()
 
         print("\nIncome:")
-        for row in rows:
+        for row in cursor:
             print(f"ID: {row[0]}, Category: {row[1]}, Amount: {row[2]},"
                   f" Pay date: {row[3]}")
-        connection.close()
     except Exception as e:
         print(f"Error: {e}")
 
@@ -564,20 +774,17 @@ def view_income_by_category():
 
     :variables:
         - `income_category` (str): The category of income to retrieve.
-        - `connection` (sqlite3.Connection): The database connection object.
         - `cursor` (sqlite3.Cursor): The database cursor object.
     """
     try:
         income_category = validate_category_input("income")
-        connection, cursor = create_connection("expense_tracker.db")
-        cursor.execute('''SELECT * FROM income WHERE category = ?''',
-                       (income_category,))
-        rows = cursor.fetchall()
+        cursor = get_cursor()
+        cursor.execute('''SELECT id, amount, pay_date FROM income
+                       WHERE category = ?''', (income_category,))
 
         print(f"\nIncome in category '{income_category}':")
-        for row in rows:
-            print(f"ID: {row[0]}, Amount: {row[2]}, Pay date: {row[3]}")
-        connection.close()
+        for row in cursor:
+            print(f"ID: {row[0]}, Amount: {row[1]}, Pay date: {row[2]}")
     except Exception as e:
         print(f"Error: {e}")
 
@@ -596,17 +803,16 @@ def update_income():
     :variables:
         - `income_category` (str): The category of the income to update.
         - `new_amount` (float): The new income amount.
-        - `connection` (sqlite3.Connection): The database connection object.
         - `cursor` (sqlite3.Cursor): The database cursor object.
     """
     try:
         print("\n--- Update An Income Amount ---")
         income_category = validate_category_input("income")
         new_amount = get_amount(prompt="Enter a new income amount: ")
-        connection, cursor = create_connection("expense_tracker.db")
-        cursor.execute('''UPDATE income SET amount = ? WHERE category = ?''',
-                       (new_amount, income_category))
-        commit_and_close(connection)
+        with write_transaction() as cursor:
+            cursor.execute('''UPDATE income SET amount = ?
+                           WHERE category = ?''',
+                           (new_amount, income_category))
         print(f"Income updated successfully for category '{income_category}'.")
     except Exception as e:
         print(f"Error: {e}")
@@ -625,10 +831,10 @@ def delete_income():
     try:
         print("\n--- Delete An Income ---")
         income_category = validate_category_input("income")
-        connection, cursor = create_connection("expense_tracker.db")
-        cursor.execute('''DELETE FROM income WHERE category = ?''',
-                       (income_category,))
-        commit_and_close(connection)
+        with write_transaction() as cursor:
+            cursor.execute('''DELETE FROM income WHERE category = ?''',
+                           (income_category,))
+        _forget_category("income", income_category)
         print(f"Income deleted successfully for category '{income_category}'.")
     except Exception as e:
         print(f"Error: {e}")
@@ -645,14 +851,10 @@ def total_income():
                         fetching the income data.
     """
     try:
-        connection, cursor = create_connection("expense_tracker.db")
-        cursor.execute('''SELECT SUM(amount) FROM income''')
+        cursor = get_cursor()
+        cursor.execute('''SELECT COALESCE(SUM(amount), 0.0) FROM income''')
         total = cursor.fetchone()[0]
-
-        if total is None:
-            total = 0.0
         print(f"Total Income: {total}")
-        connection.close()
     except Exception as e:
         print(f"Error: {e}")
 
@@ -672,30 +874,26 @@ def set_budget():
         print("\n--- Set A Budget Amount ---")
         budget_category = validate_category_input("expenses")
         budget_amount = get_amount(prompt="Enter budget amount: ")
-        connection, cursor = create_connection("expense_tracker.db")
-        # Check if the category already exists
-        cursor.execute('''SELECT budget_amount
-                       FROM budgets
-                       WHERE category = ?''', (budget_category,))
-        existing_budget = cursor.fetchone()
-
-        if existing_budget:
+        with write_transaction() as cursor:
             # Update the existing budget
             cursor.execute('''
                 UPDATE budgets
                 SET budget_amount = ?
                 WHERE category = ?
             ''', (budget_amount, budget_category))
+            updated = cursor.rowcount
+            if updated == 0:
+                # Insert a new budget
+                cursor.execute('''
+                    INSERT INTO budgets (category, budget_amount)
+                    VALUES (?, ?)
+                ''', (budget_category, budget_amount))
+        if updated:
             print(f"Budget for category '{budget_category}' "
                   f"updated successfully!")
         else:
-            # Insert a new budget
-            cursor.execute('''
-                INSERT INTO budgets (category, budget_amount)
-                VALUES (?, ?)
-            ''', (budget_category, budget_amount))
             print(f"Budget for category '{budget_category}' set successfully!")
-        commit_and_close(connection)
+        _remember_category("budgets", budget_category)
     except Exception as e:
         print(f"Error: {e}")
 
@@ -714,12 +912,11 @@ def view_budget():
     :variables:
     :variables:
         - `budget_category` (str): The category of budgets to retrieve.
-        - `connection` (sqlite3.Connection): The database connection object.
         - `cursor` (sqlite3.Cursor): The database cursor object.
     """
     try:
         budget_category = validate_category_input("expenses")
-        connection, cursor = create_connection("expense_tracker.db")
+        cursor = get_cursor()
         cursor.execute('''SELECT budget_amount FROM budgets
                        WHERE category = ?''', (budget_category,))
         result = cursor.fetchone()
@@ -728,7 +925,6 @@ def view_budget():
             print(f"Budget for {budget_category}: {result[0]}")
         else:
             print("No budget found for this category.")
-        connection.close()
     except Exception as e:
         print(f"Error: {e}")
 
@@ -747,11 +943,12 @@ def set_financial_goal():
         financial_goal = get_financial_goal(prompt="Enter a financial goal: ")
         target_amount = get_amount(prompt="Enter target amount: ")
         saved_amount = get_amount(prompt="Enter saved amount: ")
-        connection, cursor = create_connection("expense_tracker.db")
-        cursor.execute('''INSERT INTO financial_goals
-                       (goal, target_amount, saved_amount) VALUES (?, ?, ?)''',
-                       (financial_goal, target_amount, saved_amount))
-        commit_and_close(connection)
+        with write_transaction() as cursor:
+            cursor.execute('''INSERT INTO financial_goals
+                           (goal, target_amount, saved_amount)
+                           VALUES (?, ?, ?)''',
+                           (financial_goal, target_amount, saved_amount))
+        _remember_category("financial_goals", financial_goal)
         print("Financial goal set successfully!")
     except Exception as e:
         print(f"Error: {e}")
@@ -773,25 +970,24 @@ def update_financial_goal():
         - `financial_goal` (str): The financial_goal of the financial_goals to
             update.
         - `new_saved_amount` (float): The new financial goal saved amount.
-        - `connection` (sqlite3.Connection): The database connection object.
         - `cursor` (sqlite3.Cursor): The database cursor object.
     """
     try:
-        connection, cursor = create_connection("expense_tracker.db")
+        cursor = get_cursor()
         print("\n--- Update Financial Goal Saved Amount ---")
         financial_goal = validate_financial_goal_input("financial_goals")
         # Fetch the current saved amount
-        cursor.execute('''SELECT * FROM financial_goals WHERE goal = ?''',
-                       (financial_goal,))
-        result = cursor.fetchone()
-        current_saved_amount = result[3]
+        cursor.execute('''SELECT saved_amount FROM financial_goals
+                       WHERE goal = ?''', (financial_goal,))
+        current_saved_amount = cursor.fetchone()[0]
 
         print(f"Current saved amount for "
               f"'{financial_goal}': {current_saved_amount}")
         new_saved_amount = get_amount(prompt="Enter a new saved amount: ")
-        cursor.execute('''UPDATE financial_goals SET saved_amount = ?
-                       WHERE goal = ?''', (new_saved_amount, financial_goal))
-        commit_and_close(connection)
+        with write_transaction() as cursor:
+            cursor.execute('''UPDATE financial_goals SET saved_amount = ?
+                           WHERE goal = ?''',
+                           (new_saved_amount, financial_goal))
         print(f"Saved amount for financial goal '{financial_goal}' "
               f"updated successfully!")
     except Exception as e:
@@ -809,13 +1005,13 @@ def delete_financial_goal():
                         deletion of the financial goal.
     """
     try:
-        connection, cursor = create_connection("expense_tracker.db")
         print("\n--- Delete Financial Goal ---")
         financial_goal = validate_financial_goal_input("financial_goals")
         # Delete the financial goal
-        cursor.execute('''DELETE FROM financial_goals WHERE goal = ?''',
-                       (financial_goal,))
-        commit_and_close(connection)
+        with write_transaction() as cursor:
+            cursor.execute('''DELETE FROM financial_goals WHERE goal = ?''',
+                           (financial_goal,))
+        _forget_category("financial_goals", financial_goal)
         print(f"Financial goal '{financial_goal}' deleted successfully!")
     except Exception as e:
         print(f"Error: {e}")
@@ -833,19 +1029,17 @@ def view_financial_goals():
                         fetching the financial goals.
 
     :variables:
-        - `connection` (sqlite3.Connection): The database connection object.
         - `cursor` (sqlite3.Cursor): The database cursor object.
     """
     try:
-        connection, cursor = create_connection("expense_tracker.db")
-        cursor.execute('''SELECT * FROM financial_goals''')
-        rows = cursor.fetchall()
-
-        print("\nFinancial Goals:")
-        for row in rows:
-            print(f"ID: {row[0]}, Goal: {row[1]}, Target Amount: {row[2]},"
-                  f" Saved Amount: {row[3]}")
-        connection.close()
+        cursor = get_cursor()
+        cursor.execute(_STMTS["all_goals"])
+
+        out = ["\nFinancial Goals:"]
+        out.extend(f"ID: {row['id']}, Goal: {row['goal']},"
+                   f" Target Amount: {row['target_amount']},"
+                   f" Saved Amount: {row['saved_amount']}" for row in cursor)
+        sys.stdout.write("\n".join(out) + "\n")
     except Exception as e:
         print(f"Error: {e}")
 
@@ -880,36 +1074,29 @@ def budget_summary():
     :note: This function assumes that the income, expenses, budgets, and
             financial goals tables exist in the database.
     """
-    connection, cursor = create_connection("expense_tracker.db")
-    # Total income
-    cursor.execute('''SELECT SUM(amount) FROM income''')
-    total_income = cursor.fetchone()[0] or 0.0
-
-    # Total expenses
-    cursor.execute('''SELECT SUM(amount) FROM expenses''')
-    total_expenses = cursor.fetchone()[0] or 0.0
-
-    # Total budgeted amount
-    cursor.execute('''SELECT SUM(budget_amount) FROM budgets''')
-    total_budgeted = cursor.fetchone()[0] or 0.0
-
-    # Compare each category's expenses and budgets
-    cursor.execute('''SELECT category, SUM(amount)
-                   FROM expenses GROUP BY category''')
-    expense_categories = cursor.fetchall()
+    cursor = get_cursor()
+    # Totals and achieved goals (newline separated) in a single statement
+    cursor.execute(_STMTS["summary_totals"])
+    totals = cursor.fetchone()
+    total_income = totals["total_income"]
+    total_expenses = totals["total_expenses"]
+    total_budgeted = totals["total_budgeted"]
+    achieved_goals = (totals["achieved_goals"].split("\n")
+                      if totals["achieved_goals"] else [])
 
     over_budget_categories = []
     no_budget_categories = []
-    for category, expense_amount in expense_categories:
-        cursor.execute('''SELECT budget_amount
-                       FROM budgets
-                       WHERE category = ?''', (category,))
-        budget_amount = cursor.fetchone()
-        if budget_amount is None:
-            no_budget_categories.append((category, expense_amount))
-        elif expense_amount > budget_amount[0]:
-            over_budget_categories.append((category, expense_amount,
-                                           budget_amount[0]))
+    # Compare each category's expenses and budgets, if there are any
+    if totals["has_expenses"]:
+        cursor.execute(_STMTS["summary_by_category"])
+        for row in cursor.fetchall():
+            if row["budget_amount"] is None:
+                no_budget_categories.append((row["category"],
+                                             row["expense_amount"]))
+            elif row["expense_amount"] > row["budget_amount"]:
+                over_budget_categories.append((row["category"],
+                                               row["expense_amount"],
+                                               row["budget_amount"]))
 
     # Calculate remaining balance
     balance = (total_income - total_expenses)
@@ -920,40 +1107,90 @@ def budget_summary():
     else:
         budget_status = "over budget"
 
-    # Display the summary
-    print("\n----- Budget Summary -----")
-    print(f"Total Income: {total_income}")
-    print(f"Total Expenses: {total_expenses}")
-    print(f"Total Budgeted Amount: {total_budgeted}")
-    print(f"Remaining Balance (Income - Expenses): {balance}")
-    print(f"Overall Spending Status: {budget_status}")
+    # Build the summary and write it out in one go
+    out = [
+        "\n----- Budget Summary -----",
+        f"Total Income: {total_income}",
+        f"Total Expenses: {total_expenses}",
+        f"Total Budgeted Amount: {total_budgeted}",
+        f"Remaining Balance (Income - Expenses): {balance}",
+        f"Overall Spending Status: {budget_status}",
+    ]
 
     if over_budget_categories:
-        print("\nOver Budget Categories:")
-        for category, expense, budget in over_budget_categories:
-            print(f" - {category}: Spent {expense}, Budgeted {budget}")
+        out.append("\nOver Budget Categories:")
+        out.extend(f" - {category}: Spent {expense}, Budgeted {budget}"
+                   for category, expense, budget in over_budget_categories)
     else:
-        print("\nNo categories are over budget.")
+        out.append("\nNo categories are over budget.")
 
     if no_budget_categories:
-        print("\nCategories with No Budget Set:")
-        for category, expense in no_budget_categories:
-            print(f" - {category}: Spent {expense}, Budgeted None")
+        out.append("\nCategories with No Budget Set:")
+        out.extend(f" - {category}: Spent {expense}, Budgeted None"
+                   for category, expense in no_budget_categories)
     else:
-        print("\nAll expense categories have budgets set.")
-    # Financial goals achieved
-    cursor.execute('''SELECT goal FROM financial_goals
-                   WHERE saved_amount >= target_amount''')
-    achieved_goals = cursor.fetchall()
+        out.append("\nAll expense categories have budgets set.")
 
-    print("\n--- Financial Goals Status ---")
+    out.append("\n--- Financial Goals Status ---")
     if achieved_goals:
-        print("Financial goals achieved:")
-        for (goal,) in achieved_goals:
-            print(f"- {goal}")
+        out.append("Financial goals achieved:")
+        out.extend(f"- {goal}" for goal in achieved_goals)
     else:
-        print("In Progress")
-    connection.close()
+        out.append("In Progress")
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def _read_choice():
+    """
+    Reads a menu choice from the user.
+
+    Terminals are read through ``input()``. Piped or scripted input is read
+    straight from ``sys.stdin``, skipping the readline machinery.
+
+    :returns: The choice with surrounding whitespace removed.
+    :rtype: str
+
+    :raises EOFError: If the input stream is exhausted.
+    """
+    if _INTERACTIVE:
+        return input("Enter your choice: ").strip()
+    sys.stdout.write("Enter your choice: ")
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.strip()
+
+
+# Submenu choices mapped to the functions that handle them.
+EXPENSE_ACTIONS = {
+    "1": add_expense,
+    "2": view_expenses,
+    "3": view_expenses_by_category,
+    "4": update_expense,
+    "5": delete_expense,
+    "6": total_expenses,
+    "8": add_multiple_expenses,
+}
+INCOME_ACTIONS = {
+    "1": add_income,
+    "2": view_income,
+    "3": view_income_by_category,
+    "4": update_income,
+    "5": delete_income,
+    "6": total_income,
+    "8": add_multiple_incomes,
+}
+BUDGET_ACTIONS = {
+    "1": set_budget,
+    "2": view_budget,
+}
+FINANCIAL_GOAL_ACTIONS = {
+    "1": set_financial_goal,
+    "2": view_financial_goals,
+    "3": update_financial_goal,
+    "4": delete_financial_goal,
+}
 
 
 def expense_menu():
@@ -989,21 +1226,13 @@ def expense_menu():
         print("5. Delete expense")
         print("6. Total expenses")
         print("7. Back to Main Menu")
+        print("8. Add multiple expenses")
 
-        choice = input("Enter your choice: ").strip()
+        choice = _read_choice()
 
-        if choice == "1":
-            add_expense()
-        elif choice == "2":
-            view_expenses()
-        elif choice == "3":
-            view_expenses_by_category()
-        elif choice == "4":
-            update_expense()
-        elif choice == "5":
-            delete_expense()
-        elif choice == "6":
-            total_expenses()
+        action = EXPENSE_ACTIONS.get(choice)
+        if action:
+            action()
         elif choice == "7":
             break
         else:
@@ -1042,21 +1271,13 @@ def income_menu():
         print("5. Delete income")
         print("6. Total income")
         print("7. Back to Main Menu")
+        print("8. Add multiple incomes")
 
-        choice = input("Enter your choice: ").strip()
+        choice = _read_choice()
 
-        if choice == "1":
-            add_income()
-        elif choice == "2":
-            view_income()
-        elif choice == "3":
-            view_income_by_category()
-        elif choice == "4":
-            update_income()
-        elif choice == "5":
-            delete_income()
-        elif choice == "6":
-            total_income()
+        action = INCOME_ACTIONS.get(choice)
+        if action:
+            action()
         elif choice == "7":
             break
         else:
@@ -1091,12 +1312,11 @@ def budget_menu():
         print("2. View budget for a category")
         print("3. Back to Main Menu")
 
-        choice = input("Enter your choice: ").strip()
+        choice = _read_choice()
 
-        if choice == "1":
-            set_budget()
-        elif choice == "2":
-            view_budget()
+        action = BUDGET_ACTIONS.get(choice)
+        if action:
+            action()
         elif choice == "3":
             break
         else:
@@ -1134,22 +1354,27 @@ def financial_goals_menu():
         print("4. Delete a financial goal")
         print("5. Back to Main Menu")
 
-        choice = input("Enter your choice: ").strip()
+        choice = _read_choice()
 
-        if choice == "1":
-            set_financial_goal()
-        elif choice == "2":
-            view_financial_goals()
-        elif choice == "3":
-            update_financial_goal()
-        elif choice == "4":
-            delete_financial_goal()
+        action = FINANCIAL_GOAL_ACTIONS.get(choice)
+        if action:
+            action()
         elif choice == "5":
             break
         else:
             print("Invalid choice. Please try again.")
 
 
+# Main menu choices mapped to the submenus and actions they open.
+MAIN_ACTIONS = {
+    "1": expense_menu,
+    "2": income_menu,
+    "3": budget_menu,
+    "4": financial_goals_menu,
+    "5": budget_summary,
+}
+
+
 def main_menu():
     """
     Displays the main menu of the Expense and Budget Tracker application and
@@ -1195,18 +1420,11 @@ def main_menu():
         print("5. Budget Summary")
         print("6. Quit")
 
-        choice = input("Enter your choice: ").strip()
+        choice = _read_choice()
 
-        if choice == "1":
-            expense_menu()
-        elif choice == "2":
-            income_menu()
-        elif choice == "3":
-            budget_menu()
-        elif choice == "4":
-            financial_goals_menu()
-        elif choice == "5":
-            budget_summary()
+        action = MAIN_ACTIONS.get(choice)
+        if action:
+            action()
         elif choice == "6":
             print("Goodbye!")
             break